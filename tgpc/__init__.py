@@ -2,8 +2,27 @@
 TGPC Rx Registry System
 """
 
-from tgpc.utils import Config, setup_logging
-from tgpc.scraper import Scraper
-from tgpc.manager import Manager
+import importlib
 
 __version__ = "2.0.0"
+
+# Public names are resolved on first access (PEP 562) so that importing the
+# package, e.g. for `python -m tgpc --help`, does not pull in requests, bs4
+# and the Supabase client up front.
+_LAZY_IMPORTS = {
+    "Config": "tgpc.utils",
+    "setup_logging": "tgpc.utils",
+    "Scraper": "tgpc.scraper",
+    "Manager": "tgpc.manager",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
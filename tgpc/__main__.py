@@ -2,9 +2,7 @@
 CLI entry point for TGPC system.
 """
 
-import sys
 import argparse
-from tgpc.manager import Manager
 
 def main():
     parser = argparse.ArgumentParser(description="TGPC Rx Registry Manager")
@@ -17,13 +15,14 @@ def main():
     sync_parser = subparsers.add_parser('sync', help='Sync data to Supabase')
 
     args = parser.parse_args()
-    
-    manager = Manager()
 
+    # Imported after dispatch so --help and usage errors stay fast
     if args.command == 'update':
-        manager.run_daily_update()
+        from tgpc.manager import Manager
+        Manager().run_daily_update()
     elif args.command == 'sync':
-        manager.sync_to_supabase()
+        from tgpc.manager import Manager
+        Manager().sync_to_supabase()
     else:
         parser.print_help()
 
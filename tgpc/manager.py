@@ -7,11 +7,13 @@ import json
 import shutil
 import hashlib
 import os
+import sys
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Tuple
-from dataclasses import asdict
+from dataclasses import asdict, fields
 
+import orjson
 from supabase import create_client
 
 from tgpc.utils import Config, TGPCError, setup_logging
@@ -31,9 +33,38 @@ class FileManager:
         path = self.data_dir / filename
         data = [r.to_dict() for r in records]
         
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
-        logger.info(f"Saved {len(records)} records to {path}")
+        # orjson emits the same 2-space layout as json.dump, as UTF-8 bytes
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str)
+        
+        # Write to a temp file and rename over the target so a crash mid-write
+        # never leaves a truncated rx.json behind
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except Exception:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            raise
+        
+        # Persist the rename; best-effort since directories can't be opened on Windows
+        try:
+            dir_fd = os.open(self.data_dir, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+        except OSError:
+            pass
+        else:
+            try:
+                os.fsync(dir_fd)
+            except OSError:
+                pass
+            finally:
+                os.close(dir_fd)
+        logger.info("Saved %d records to %s", len(records), path)
         return path
 
     def load(self, filename: str = "rx.json") -> List[PharmacistRecord]:
@@ -41,10 +72,18 @@ class FileManager:
         path = self.data_dir / filename
         if not path.exists(): return []
         
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            
-        return [PharmacistRecord(**d) for d in data]
+        data = orjson.loads(path.read_bytes())
+        
+        # Older files carry extra keys (status, photo_data, ...) outside the schema
+        known = {f.name for f in fields(PharmacistRecord)}
+        records = []
+        for d in data:
+            record = PharmacistRecord(**{k: v for k, v in d.items() if k in known})
+            # Only a handful of distinct categories; share one string object each
+            if record.category:
+                record.category = sys.intern(record.category)
+            records.append(record)
+        return records
 
 class BackupManager:
     """Handles secure backups."""
@@ -60,16 +99,17 @@ class BackupManager:
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         dest = self.backup_dir / f"rx_backup_{ts}.json"
         shutil.copy2(source, dest)
-        logger.info(f"Backup created: {dest}")
+        logger.info("Backup created: %s", dest)
         return str(dest)
 
     def cleanup(self, days: int = 30):
         """Remove old backups."""
-        cutoff = datetime.now() - timedelta(days=days)
+        # Fixed-width timestamps sort lexicographically in date order
+        cutoff = (datetime.now() - timedelta(days=days)).strftime("%Y%m%d_%H%M%S")
         for f in self.backup_dir.glob("rx_backup_*.json"):
             try:
                 ts = f.stem.split('_', 2)[2]
-                if datetime.strptime(ts, "%Y%m%d_%H%M%S") < cutoff:
+                if len(ts) == len(cutoff) and ts < cutoff:
                     f.unlink()
             except: pass
 
@@ -80,7 +120,7 @@ class Manager:
         self.config = Config.load()
         self.file_manager = FileManager(self.config)
         self.backup_manager = BackupManager(self.config)
-        self.scraper = Scraper()
+        self.scraper = Scraper(self.config)
 
     def run_daily_update(self):
         """Execute daily update workflow."""
@@ -98,8 +138,9 @@ class Manager:
 
         # Safety Check: Prevent massive data loss
         existing_records = self.file_manager.load()
-        if existing_records and len(fresh_records) < len(existing_records) * 0.9:
-            logger.error(f"Safety Alert: New count ({len(fresh_records)}) < 90% of existing ({len(existing_records)}). Aborting.")
+        # Integer comparison: fresh < 90% of existing
+        if existing_records and len(fresh_records) * 10 < len(existing_records) * 9:
+            logger.error("Safety Alert: New count (%d) < 90%% of existing (%d). Aborting.", len(fresh_records), len(existing_records))
             return
 
         # 3. Validate & Save
@@ -111,33 +152,31 @@ class Manager:
         existing_map = {r.registration_number: r for r in existing_records}
         current_map = {r.registration_number: r for r in sorted_records}
         
-        existing_ids = set(existing_map.keys())
-        current_ids = set(current_map.keys())
-        
-        new_ids = current_ids - existing_ids
-        removed_ids = existing_ids - current_ids
-        common_ids = current_ids & existing_ids
+        # Membership tests go straight against the dicts; no key sets are built
+        new_details = []
+        modified_details = []
+        for rid, r in current_map.items():
+            old = existing_map.get(rid)
+            if old is None:
+                new_details.append(f"{r.registration_number} - {r.name}")
+            elif old != r:
+                modified_details.append(f"{r.registration_number} - {r.name}")
+        removed_details = [f"{r.registration_number} - {r.name}" for rid, r in existing_map.items() if rid not in current_map]
         
-        new_count = len(new_ids)
-        removed_count = len(removed_ids)
+        new_count = len(new_details)
+        removed_count = len(removed_details)
+        modified_count = len(modified_details)
         total_count = len(sorted_records)
         duplicates = len(fresh_records) - len(sorted_records)
-        
-        # Detailed changes
-        new_details = [f"{current_map[i].registration_number} - {current_map[i].name}" for i in new_ids]
-        removed_details = [f"{existing_map[i].registration_number} - {existing_map[i].name}" for i in removed_ids]
-        
-        modified_count = 0
-        modified_details = []
-        for rid in common_ids:
-            if existing_map[rid] != current_map[rid]:
-                modified_count += 1
-                modified_details.append(f"{current_map[rid].registration_number} - {current_map[rid].name}")
 
-        self.file_manager.save(list(sorted_records))
+        # Skip the full rewrite when the registry is unchanged, order included
+        if sorted_records == existing_records:
+            logger.info("No changes detected, rx.json left untouched")
+        else:
+            self.file_manager.save(sorted_records)
         self.backup_manager.cleanup()
         
-        logger.info(f"Update complete. Total: {total_count}, New: {new_count}, Removed: {removed_count}, Modified: {modified_count}")
+        logger.info("Update complete. Total: %d, New: %d, Removed: %d, Modified: %d", total_count, new_count, removed_count, modified_count)
 
         # Output for GitHub Actions
         if os.environ.get('GITHUB_OUTPUT'):
@@ -168,17 +207,17 @@ class Manager:
             supabase = create_client(url, key)
             records = self.file_manager.load()
             
-            logger.info(f"Syncing {len(records)} records to Supabase...")
+            logger.info("Syncing %d records to Supabase...", len(records))
             
             # Batch upsert
             batch_size = 1000
             for i in range(0, len(records), batch_size):
                 batch = [r.to_dict() for r in records[i:i+batch_size]]
                 supabase.table('rx').upsert(batch, on_conflict='registration_number').execute()
-                logger.info(f"Synced batch {i//batch_size + 1}")
+                logger.info("Synced batch %d", i//batch_size + 1)
                 
             logger.info("Supabase sync complete")
             
         except Exception as e:
-            logger.error(f"Sync failed: {e}")
+            logger.error("Sync failed: %s", e)
 
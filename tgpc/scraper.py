@@ -3,9 +3,10 @@ Core scraping logic for TGPC system.
 Handles data extraction, rate limiting, and parsing.
 """
 
+import sys
 import time
 import random
-from typing import Optional
+from typing import List, Optional
 from dataclasses import dataclass
 
 import requests
@@ -16,6 +17,13 @@ from tgpc.utils import Config, TGPCError, setup_logging
 
 logger = setup_logging("tgpc.scraper")
 
+# Prefer the C-backed lxml parser; fall back to the stdlib one if missing
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
+
 # --- Models ---
 
 @dataclass
@@ -67,8 +75,8 @@ class RateLimiter:
 class Scraper:
     """Main scraper class."""
 
-    def __init__(self):
-        self.config = Config.load()
+    def __init__(self, config: Optional[Config] = None):
+        self.config = config or Config.load()
         self.rate_limiter = RateLimiter(self.config)
         self.session = requests.Session()
         self.session.headers.update({'User-Agent': self.config.user_agent})
@@ -95,7 +103,7 @@ class Scraper:
         """Get total number of pharmacists."""
         try:
             response = self._request("GET", self.urls['total'])
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, _HTML_PARSER)
             
             # Try to find table
             table = soup.find('table', attrs={'id': 'tablesorter-demo'})
@@ -117,7 +125,7 @@ class Scraper:
                     pass
             
             count = len(set(serials)) if serials else len(rows)
-            logger.info(f"Total count: {count}")
+            logger.info("Total count: %d", count)
             return count
             
         except Exception as e:
@@ -127,7 +135,7 @@ class Scraper:
         """Extract all basic records."""
         logger.info("Extracting basic records...")
         response = self._request("GET", self.urls['total'])
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, _HTML_PARSER)
         
         records = []
         table = soup.find('table', attrs={'id': 'tablesorter-demo'}) or soup.find('table')
@@ -139,18 +147,19 @@ class Scraper:
             cells = row.find_all('td')
             if len(cells) < 5:
                 continue
+
+            # Single pass over the cells, unpacked into named columns
+            serial, reg_no, name, father, category, *_ = (c.get_text(strip=True) for c in cells)
+            records.append(PharmacistRecord(
+                # isdecimal, not isdigit: int() rejects digit-like chars such as '²'
+                serial_number=int(serial) if serial.isdecimal() else None,
+                registration_number=reg_no,
+                name=name,
+                father_name=father,
+                # Interned to match FileManager.load, so the daily diff compares by identity
+                category=sys.intern(category)
+            ))
                 
-            try:
-                records.append(PharmacistRecord(
-                    serial_number=int(cells[0].get_text(strip=True)) if cells[0].get_text(strip=True).isdigit() else None,
-                    registration_number=cells[1].get_text(strip=True),
-                    name=cells[2].get_text(strip=True),
-                    father_name=cells[3].get_text(strip=True),
-                    category=cells[4].get_text(strip=True)
-                ))
-            except Exception:
-                continue
-                
-        logger.info(f"Extracted {len(records)} records")
+        logger.info("Extracted %d records", len(records))
         return records
 
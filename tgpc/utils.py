@@ -19,9 +19,9 @@ class TGPCError(Exception):
 
 # --- Configuration ---
 
-@dataclass
+@dataclass(frozen=True)
 class Config:
-    """Configuration for TGPC system."""
+    """Configuration for TGPC system (immutable once loaded)."""
     
     # API Settings
     base_url: str = "https://www.pharmacycouncil.telangana.gov.in"